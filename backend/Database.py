@@ -8,13 +8,30 @@ load_dotenv()
 
 DB_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DB_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Explicit pool sizing: the defaults (pool_size=5) starve concurrent requests
+# under load. pre_ping drops stale connections, recycle avoids server-side
+# timeouts, and LIFO checkout keeps a small subset of connections hot.
+engine = create_engine(
+    DB_URL,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+)
+# expire_on_commit=False keeps attributes readable after the final commit so
+# INSERT ... RETURNING rows serialize without a follow-up SELECT.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 def get_db():
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        # Handlers buffer side-effect writes (audit/notification rows) and
+        # commit once; discard the buffer if the request fails mid-way.
+        db.rollback()
+        raise
     finally:
-        db.close() 
+        db.close()
@@ -1,11 +1,33 @@
-from datetime import datetime
-
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import expression
 
 from .Database import Base
 
 
+class utcnow(expression.FunctionElement):
+    """Server-side UTC timestamp for the naive DateTime columns.
+
+    Postgres's now()/CURRENT_TIMESTAMP is session-timezone local, which
+    would break the naive-UTC invariant the serializers stamp with "Z";
+    SQLite's CURRENT_TIMESTAMP is already UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "(now() at time zone 'utc')"
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -17,12 +39,14 @@ class User(Base):
     status = Column(String, default="active")
     is_active = Column(Boolean, default=True)
     token_version = Column(Integer, default=1)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
     candidate_profile = relationship("Candidate", back_populates="user", uselist=False)
     interviews = relationship("Interview", back_populates="interviewer")
     feedbacks = relationship("InterviewFeedback", back_populates="interviewer")
-    audit_logs = relationship("AuditLog", back_populates="user")
+    # Wide fan-out collections: raise instead of silently lazy-loading
+    # thousands of rows; callers that need them must opt in with selectinload.
+    audit_logs = relationship("AuditLog", back_populates="user", lazy="raise_on_sql")
 
 
 class Candidate(Base):
@@ -34,14 +58,15 @@ class Candidate(Base):
     skills = Column(Text, nullable=True)
     experience_years = Column(Integer, nullable=True)
     resume_path = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
     user = relationship("User", back_populates="candidate_profile")
     applications = relationship("Application", back_populates="candidate")
-    notifications = relationship("CandidateNotification", back_populates="candidate_profile")
+    notifications = relationship("CandidateNotification", back_populates="candidate_profile", lazy="raise_on_sql")
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (Index("ix_job_owner", "owner_hr_id"),)
 
     job_id = Column(Integer, primary_key=True, index=True)
     owner_hr_id = Column(Integer, ForeignKey("users.user_id"), nullable=True)
@@ -50,22 +75,25 @@ class Job(Base):
     department = Column(String, nullable=True)
     experience_required = Column(Integer, nullable=True)
     job_status = Column(String, default="draft")
-    posted_date = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    posted_date = Column(DateTime, server_default=utcnow())
+    created_at = Column(DateTime, server_default=utcnow())
+
 
-   
-    applications = relationship("Application", back_populates="job")
+    applications = relationship("Application", back_populates="job", lazy="raise_on_sql")
 
 
 class Application(Base):
     __tablename__ = "applications"
+    # The unique index doubles as the DB-level duplicate-application guard
+    # behind the pre-check in apply_job.
+    __table_args__ = (Index("ix_app_job_cand", "job_id", "candidate_id", unique=True),)
 
     application_id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("candidates.candidate_id"), nullable=False)
     job_id = Column(Integer, ForeignKey("jobs.job_id"), nullable=False)
     application_status = Column(String, default="applied")
-    applied_date = Column(DateTime, default=datetime.utcnow)
-    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    applied_date = Column(DateTime, server_default=utcnow())
+    last_updated = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     candidate = relationship("Candidate", back_populates="applications")
     job = relationship("Job", back_populates="applications")
@@ -75,6 +103,19 @@ class Application(Base):
 
 class Interview(Base):
     __tablename__ = "interviews"
+    # The partial unique index closes the check-then-insert race on exact
+    # double-booking; cancelled/completed interviews don't block the slot.
+    __table_args__ = (
+        Index("ix_iv_interviewer_date", "interviewer_id", "interview_date"),
+        Index(
+            "uq_iv_slot",
+            "interviewer_id",
+            "interview_date",
+            unique=True,
+            postgresql_where=text("interview_status IN ('scheduled', 'rescheduled')"),
+            sqlite_where=text("interview_status IN ('scheduled', 'rescheduled')"),
+        ),
+    )
 
     interview_id = Column(Integer, primary_key=True, index=True)
     application_id = Column(Integer, ForeignKey("applications.application_id"), nullable=False)
@@ -82,7 +123,7 @@ class Interview(Base):
     interview_type = Column(String, nullable=False)
     interviewer_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     interview_status = Column(String, default="scheduled")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
     application = relationship("Application", back_populates="interviews")
     interviewer = relationship("User", back_populates="interviews")
@@ -98,7 +139,7 @@ class InterviewFeedback(Base):
     rating = Column(Float, nullable=True)
     comments = Column(Text, nullable=True)
     recommendation = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
     interview = relationship("Interview", back_populates="feedback")
     interviewer = relationship("User", back_populates="feedbacks")
@@ -106,6 +147,7 @@ class InterviewFeedback(Base):
 
 class CandidateNotification(Base):
     __tablename__ = "candidate_notifications"
+    __table_args__ = (Index("ix_notif_candidate", "candidate_id"),)
 
     notification_id = Column(Integer, primary_key=True, index=True)
     candidate_id = Column(Integer, ForeignKey("candidates.candidate_id"), nullable=False)
@@ -113,7 +155,7 @@ class CandidateNotification(Base):
     message = Column(Text, nullable=False)
     related_application_id = Column(Integer, ForeignKey("applications.application_id"), nullable=True)
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
     candidate_profile = relationship("Candidate", back_populates="notifications")
     application = relationship("Application", back_populates="notifications")
@@ -125,7 +167,7 @@ class AuditLog(Base):
     log_id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     action = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, server_default=utcnow())
     ip_address = Column(String, nullable=True)
 
     user = relationship("User", back_populates="audit_logs")
@@ -1,8 +1,15 @@
+import base64
+import hashlib
+import hmac
 import os
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
+import anyio
 import bcrypt
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -14,6 +21,9 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_MINUTES = 30
 REFRESH_TOKEN_DAYS = 7
+# Cost factor for bcrypt; each +1 doubles hashing time. Hashes created with
+# a different cost are transparently upgraded on the next successful login.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10"))
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -32,7 +42,43 @@ def hash_password(password: str) -> str:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password is too long. Please use 72 bytes or fewer.",
         )
-        return bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode("utf-8")
+        return bcrypt.hashpw(password_bytes, bcrypt.gensalt(BCRYPT_ROUNDS)).decode("utf-8")
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash uses a cost factor other than BCRYPT_ROUNDS."""
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Run bcrypt verification in a worker thread so the event loop stays free.
+
+    bcrypt releases the GIL, so concurrent logins verify in parallel; anyio's
+    default thread limiter provides back-pressure when many requests pile up.
+    """
+    return await anyio.to_thread.run_sync(verify_password, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Run bcrypt hashing in a worker thread so the event loop stays free."""
+    return await anyio.to_thread.run_sync(hash_password, password)
+
+
+# Signing inputs prepared once at import: key bytes and the base64url-encoded
+# HS256 header are constant, so per-token work is one orjson dump + one HMAC.
+_JWT_KEY = (SECRET_KEY or "").encode("utf-8")
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+# Keyed HMAC template: .copy() reuses the key schedule, so issuing the
+# access/refresh pair in login costs two digests but only one key setup.
+_JWT_SIGNER = hmac.new(_JWT_KEY, digestmod=hashlib.sha256)
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
 
 def _create_token(subject: str, token_type: str, expires_delta: timedelta, extra: Dict[str, Any] | None = None) -> str:
     now = datetime.now(timezone.utc)
@@ -44,7 +90,10 @@ def _create_token(subject: str, token_type: str, expires_delta: timedelta, extra
     }
     if extra:
         payload.update(extra)
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+    mac = _JWT_SIGNER.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
 
 
 def create_access_token(user_id: int, role: str, token_version: int) -> str:
@@ -65,11 +114,30 @@ def create_refresh_token(user_id: int, token_version: int) -> str:
     )
 
 
+# Decoded-payload cache keyed by a short token digest. The 30s TTL is well
+# under token lifetime and safe because token_version revocation is enforced
+# separately against the DB in _current_db_user. Sync endpoints run on the
+# threadpool, so guard the cache with a lock — TTLCache mutates its expiry
+# list even on reads and is not thread-safe.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> Dict[str, Any]:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        if cached["exp"] < datetime.now(timezone.utc).timestamp():
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        return cached
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
 
 
 def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
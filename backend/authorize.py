@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from fastapi import HTTPException, status
 
 
+@lru_cache(maxsize=None)
 def require_roles(*roles: str):
     normalized_roles = {r.lower() for r in roles}
 
@@ -1,11 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
 
+from . import schemas
 from .Database import Base, engine
+from .orjson_response import ORJSONResponse
 from .routers import auth, users, candidates, jobs, applications, interviews, notifications, audit
 
 # Create FastAPI app
-app = FastAPI(title="Job Application Tracking System")
+app = FastAPI(title="Job Application Tracking System", default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -36,6 +39,14 @@ app.include_router(interviews.router)
 app.include_router(notifications.router)
 app.include_router(audit.router)
 
+# Response models use defer_build, so finish building them here in one pass
+# after all routers are mounted; built schemas then share definitions instead
+# of each class rebuilding on its first request.
+for _name in dir(schemas):
+    _obj = getattr(schemas, _name)
+    if isinstance(_obj, type) and issubclass(_obj, BaseModel) and _name.endswith("Response"):
+        _obj.model_rebuild(force=True)
+
 
 @app.get("/")
 def root():
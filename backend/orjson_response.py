@@ -0,0 +1,34 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+# DB timestamps are stored naive UTC (DateTime without timezone); treating
+# them as UTC and writing the Z suffix lets orjson emit the ISO bytes in one
+# pass with no Python-side formatting or offset arithmetic.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _default(value: Any):
+    """Fallback for the few types orjson does not encode natively
+    (Decimal from aggregates, constrained-string subclasses, etc.)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, str):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """App-wide default response class rendering through orjson.
+
+    Bypasses stdlib json entirely; naive datetimes are treated as UTC so
+    DB timestamps serialize without Python-side ISO formatting.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
@@ -1,17 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import exists, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 
 from ..authentication import get_current_user
 from ..authorize import enforce_owner_or_admin, require_roles
 from ..Database import get_db
-from ..Models import Application, Candidate, Interview, Job
-from ..schemas import ApplicationCreate, ApplicationUpdate, BulkStatusUpdate
-from .dependencies import APP_TRANSITIONS, _audit, _current_db_user, _notify
+from ..orjson_response import ORJSON_OPTIONS
+from ..Models import Application, AuditLog, Candidate, CandidateNotification, Interview, Job
+from ..schemas import ApplicationCreate, ApplicationResponse, ApplicationUpdate, BulkStatusUpdate
+from ..structs import application_detail_struct
+from .dependencies import APP_TRANSITIONS, _EMPTY_TRANSITIONS, _audit, _check_token_version, _current_db_user, _notify
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
 
-@router.post("")
+@router.post("", responses={200: {"model": ApplicationResponse}})
 def apply_job(
     payload: ApplicationCreate,
     current=Depends(get_current_user),
@@ -31,32 +37,40 @@ def apply_job(
     if job.job_status != "open":
         raise HTTPException(status_code=400, detail="Only open jobs accept applications")
 
-    dup = (
-        db.query(Application)
-        .filter(Application.job_id == payload.job_id, Application.candidate_id == candidate.candidate_id)
-        .first()
-    )
+    dup = db.query(
+        exists().where(
+            Application.job_id == payload.job_id,
+            Application.candidate_id == candidate.candidate_id,
+        )
+    ).scalar()
     if dup:
         raise HTTPException(status_code=400, detail="Duplicate application not allowed")
 
-    app_row = Application(
-        candidate_id=candidate.candidate_id,
-        job_id=payload.job_id,
-        application_status="applied"
-    )
-    db.add(app_row)
-    db.commit()
-    db.refresh(app_row)
-    
+    try:
+        app_row = db.execute(
+            insert(Application)
+            .values(
+                candidate_id=candidate.candidate_id,
+                application_status="applied",
+                **payload.dump_insert(),
+            )
+            .returning(Application)
+        ).scalar_one()
+    except IntegrityError:
+        # Concurrent duplicate slipped past the exists() pre-check; the
+        # unique index on (job_id, candidate_id) turns the race into the
+        # same 400 the pre-check gives.
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Duplicate application not allowed")
     _audit(db, user.user_id, f"application_created:{app_row.application_id}:job_{payload.job_id}")
     _notify(db, candidate.candidate_id, "Application submitted", "info", app_row.application_id)
     db.commit()
-    db.refresh(app_row)
-    return app_row
+    return Response(ApplicationResponse.__fast_json__(app_row), media_type="application/json")
 
 
 @router.get("")
 def list_applications(
+    request: Request,
     page: int = 1,
     page_size: int = 20,
     current=Depends(get_current_user),
@@ -65,7 +79,12 @@ def list_applications(
     """List applications based on user role"""
     user = _current_db_user(current, db)
 
-    q = db.query(Application)
+    # Eager-load the relationships serialized with each row; without this,
+    # every application in the page triggers two lazy SELECTs (N+1).
+    q = db.query(Application).options(
+        selectinload(Application.candidate),
+        selectinload(Application.job),
+    )
 
     if user.role == "admin" or user.role == "hr":
         pass  # no extra filter
@@ -89,10 +108,22 @@ def list_applications(
         .limit(page_size)
         .all()
     )
-    return {"total": total, "page": page, "page_size": page_size, "items": items}
+    # Rows (with their eager-loaded candidate/job) are trusted DB output, so
+    # encode them through msgspec structs instead of the pydantic path.
+    payload = {
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "items": [application_detail_struct(a) for a in items],
+    }
+    # Internal service-to-service callers ask for MessagePack to cut bytes
+    # on the wire; browsers keep getting JSON.
+    if "application/msgpack" in request.headers.get("accept", ""):
+        return Response(msgspec.msgpack.encode(payload), media_type="application/msgpack")
+    return Response(msgspec.json.encode(payload), media_type="application/json")
 
 
-@router.patch("/{application_id}/state")
+@router.patch("/{application_id}/state", responses={200: {"model": ApplicationResponse}})
 def update_application_state(
     application_id: int,
     payload: ApplicationUpdate,
@@ -100,7 +131,7 @@ def update_application_state(
     db: Session = Depends(get_db),
 ):
     """Update application status (HR/Admin)"""
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     require_roles("hr", "admin")(current)
     
     app_row = db.query(Application).filter(Application.application_id == application_id).first()
@@ -110,7 +141,7 @@ def update_application_state(
     job = db.query(Job).filter(Job.job_id == app_row.job_id).first()
     enforce_owner_or_admin(current, job.owner_hr_id)
 
-    if payload.application_status not in APP_TRANSITIONS.get(app_row.application_status, set()):
+    if payload.application_status not in APP_TRANSITIONS.get(app_row.application_status, _EMPTY_TRANSITIONS):
         raise HTTPException(status_code=400, detail="Invalid application transition")
     
     old_status = app_row.application_status
@@ -125,10 +156,71 @@ def update_application_state(
         application_id
     )
     db.commit()
-    return app_row
+    return Response(ApplicationResponse.__fast_json__(app_row), media_type="application/json")
 
 # ------------------  bulk_shortlist / bulk_reject / search_applications  is only for docs test , it's not implement  in front end -----------------#  
 
+def _bulk_update_status(payload: BulkStatusUpdate, current: dict, db: Session, new_status: str) -> dict:
+    """Move eligible applications to new_status in three round-trips:
+    one SELECT of the target rows, one bulk UPDATE, one bulk INSERT of
+    notifications and audit entries. Rows in a state that cannot reach
+    new_status (or owned by another HR) are skipped, not errors."""
+    _check_token_version(current, db)
+    require_roles("hr", "admin")(current)
+
+    valid_prevs = [s for s, nxts in APP_TRANSITIONS.items() if new_status in nxts]
+    rows = (
+        db.query(
+            Application.application_id,
+            Application.application_status,
+            Application.candidate_id,
+            Job.owner_hr_id,
+        )
+        .join(Job, Application.job_id == Job.job_id)
+        .filter(
+            Application.application_id.in_(payload.application_ids),
+            Application.application_status.in_(valid_prevs),
+        )
+        .all()
+    )
+
+    is_admin = str(current.get("role", "")).lower() == "admin"
+    eligible = [r for r in rows if is_admin or r.owner_hr_id == current["user_id"]]
+    if not eligible:
+        return {"updated": 0}
+
+    db.execute(
+        update(Application)
+        .where(Application.application_id.in_([r.application_id for r in eligible]))
+        .values(application_status=new_status)
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        insert(CandidateNotification),
+        [
+            {
+                "candidate_id": r.candidate_id,
+                "message": f"Application moved to {new_status}",
+                "notification_type": "action_required",
+                "related_application_id": r.application_id,
+            }
+            for r in eligible
+        ],
+    )
+    db.execute(
+        insert(AuditLog),
+        [
+            {
+                "user_id": current["user_id"],
+                "action": f"application_status_changed:{r.application_id}:{r.application_status}->{new_status}",
+            }
+            for r in eligible
+        ],
+    )
+    db.commit()
+    return {"updated": len(eligible)}
+
+
 @router.post("/bulk-shortlist")
 def bulk_shortlist(
     payload: BulkStatusUpdate,
@@ -136,14 +228,7 @@ def bulk_shortlist(
     db: Session = Depends(get_db)
 ):
     """Bulk shortlist applications (HR/Admin)"""
-    for app_id in payload.application_ids:
-        update_application_state(
-            app_id,
-            ApplicationUpdate(application_status="shortlisted"),
-            current,
-            db
-        )
-    return {"updated": len(payload.application_ids)}
+    return _bulk_update_status(payload, current, db, "shortlisted")
 
 
 @router.post("/bulk-reject")
@@ -153,14 +238,7 @@ def bulk_reject(
     db: Session = Depends(get_db)
 ):
     """Bulk reject applications (HR/Admin)"""
-    for app_id in payload.application_ids:
-        update_application_state(
-            app_id,
-            ApplicationUpdate(application_status="rejected"),
-            current,
-            db
-        )
-    return {"updated": len(payload.application_ids)}
+    return _bulk_update_status(payload, current, db, "rejected")
 
 
 @router.get("/search")
@@ -193,9 +271,22 @@ def search_applications(
         .all()
     )
 
-    return {
+    # One comprehension into plain dicts and a single orjson.dumps; no
+    # per-row encoder pass over the ORM objects.
+    payload = {
         "total": total,
         "page": page,
         "limit": limit,
-        "results": results
+        "results": [
+            {
+                "application_id": a.application_id,
+                "candidate_id": a.candidate_id,
+                "job_id": a.job_id,
+                "application_status": a.application_status,
+                "applied_date": a.applied_date,
+                "last_updated": a.last_updated,
+            }
+            for a in results
+        ],
     }
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), media_type="application/json")
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from ..authentication import get_current_user
 from ..authorize import require_roles
 from ..Database import get_db
 from ..Models import AuditLog
-from .dependencies import _current_db_user
+from ..orjson_response import ORJSONResponse
+from ..schemas import AUDIT_LOG_LIST_ADAPTER, dump_rows
+from .dependencies import _check_token_version
 
 router = APIRouter(prefix="/audit-logs", tags=["Audit"])
 
@@ -17,6 +19,7 @@ def audit_logs(
 ):
     """Get all audit logs (Admin only)"""
     require_roles("admin")(current)
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     
-    return db.query(AuditLog).order_by(AuditLog.timestamp.desc()).all()
+    rows = db.query(AuditLog).options(raiseload("*")).order_by(AuditLog.timestamp.desc()).all()
+    return ORJSONResponse(dump_rows(AUDIT_LOG_LIST_ADAPTER, rows))
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from ..authentication import get_current_user
 from ..authorize import require_roles
 from ..Database import get_db
+from ..orjson_response import ORJSON_OPTIONS
+from ..orjson_response import ORJSONResponse
 from ..Models import Application, Candidate, Interview, User
-from ..schemas import CandidateUpdate
+from ..schemas import CandidateResponse, CandidateUpdate
 from .dependencies import _current_db_user
 from .interviews import _auto_complete_overdue
 
@@ -37,12 +40,33 @@ def _build_full_candidate_payload(db: Session, candidate: Candidate) -> dict:
             "experience_years": candidate.experience_years,
             "resume_path": candidate.resume_path,
         },
-        "applications": applications,
-        "interviews": interviews,
+        "applications": [
+            {
+                "application_id": a.application_id,
+                "candidate_id": a.candidate_id,
+                "job_id": a.job_id,
+                "application_status": a.application_status,
+                "applied_date": a.applied_date,
+                "last_updated": a.last_updated,
+            }
+            for a in applications
+        ],
+        "interviews": [
+            {
+                "interview_id": i.interview_id,
+                "application_id": i.application_id,
+                "interview_date": i.interview_date,
+                "interview_type": i.interview_type,
+                "interviewer_id": i.interviewer_id,
+                "interview_status": i.interview_status,
+                "created_at": i.created_at,
+            }
+            for i in interviews
+        ],
     }
 
 
-@router.get("/candidate/profile")
+@router.get("/candidate/profile", responses={200: {"model": CandidateResponse}})
 def get_candidate_profile(
     current=Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -54,10 +78,10 @@ def get_candidate_profile(
     profile = db.query(Candidate).filter(Candidate.user_id == current_user.user_id).first()
     if not profile:
         raise HTTPException(status_code=404, detail="Candidate profile not found")
-    return profile
+    return Response(CandidateResponse.__fast_json__(profile), media_type="application/json")
 
 
-@router.post("/candidate/profile")
+@router.post("/candidate/profile", responses={200: {"model": CandidateResponse}})
 def create_candidate_profile(
     payload: CandidateUpdate,
     current=Depends(get_current_user),
@@ -81,10 +105,10 @@ def create_candidate_profile(
     db.add(profile)
     db.commit()
     db.refresh(profile)
-    return profile
+    return Response(CandidateResponse.__fast_json__(profile), media_type="application/json")
 
 
-@router.patch("/candidate/profile")
+@router.patch("/candidate/profile", responses={200: {"model": CandidateResponse}})
 def update_candidate_profile(
     payload: CandidateUpdate,
     current=Depends(get_current_user),
@@ -109,7 +133,7 @@ def update_candidate_profile(
 
     db.commit()
     db.refresh(profile)
-    return profile
+    return Response(CandidateResponse.__fast_json__(profile), media_type="application/json")
 
 
 @router.get("/candidates/{candidate_id}/full-profile")
@@ -140,7 +164,9 @@ def get_full_candidate_profile(
         raise HTTPException(status_code=404, detail="Candidate not found")
 
     _auto_complete_overdue(db)
-    return _build_full_candidate_payload(db, candidate)
+    # Return the response class directly so datetimes reach orjson intact
+    # (UTC "Z" form) instead of being pre-stringified by jsonable_encoder.
+    return ORJSONResponse(_build_full_candidate_payload(db, candidate))
 
 
 @router.get("/candidates/dashboard")
@@ -165,7 +191,7 @@ def candidates_dashboard(
         ids = [row[0] for row in candidate_ids]
         candidates = db.query(Candidate).filter(Candidate.candidate_id.in_(ids)).all() if ids else []
 
-    return [_build_full_candidate_payload(db, candidate) for candidate in candidates]
+    return ORJSONResponse([_build_full_candidate_payload(db, candidate) for candidate in candidates])
 
 
 @router.get("/candidates/search")
@@ -197,9 +223,23 @@ def search_candidates(
         .all()
     )
 
-    return {
+    # One comprehension into plain dicts and a single orjson.dumps; no
+    # per-row encoder pass over the ORM objects.
+    payload = {
         "total": total,
         "page": page,
         "limit": limit,
-        "results": results
+        "results": [
+            {
+                "candidate_id": c.candidate_id,
+                "user_id": c.user_id,
+                "phone": c.phone,
+                "skills": c.skills,
+                "experience_years": c.experience_years,
+                "resume_path": c.resume_path,
+                "created_at": c.created_at,
+            }
+            for c in results
+        ],
     }
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), media_type="application/json")
@@ -1,29 +1,36 @@
+import threading
+
+from cachetools import TTLCache
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from ..Models import User, AuditLog, CandidateNotification
 
 
+# Shared empty frozenset so transition lookups on terminal/unknown states
+# don't allocate a fresh set per check.
+_EMPTY_TRANSITIONS = frozenset()
+
 JOB_TRANSITIONS = {
-    "draft": {"open", "archived"},
-    "open": {"closed"},
-    "closed": {"archived"},
-    "archived": set(),
+    "draft": frozenset({"open", "archived"}),
+    "open": frozenset({"closed"}),
+    "closed": frozenset({"archived"}),
+    "archived": _EMPTY_TRANSITIONS,
 }
 
 APP_TRANSITIONS = {
-    "applied": {"shortlisted", "rejected"},
-    "shortlisted": {"interview_scheduled", "rejected"},
-    "interview_scheduled": {"hired", "rejected"},
-    "rejected": set(),
-    "hired": set(),
+    "applied": frozenset({"shortlisted", "rejected"}),
+    "shortlisted": frozenset({"interview_scheduled", "rejected"}),
+    "interview_scheduled": frozenset({"hired", "rejected"}),
+    "rejected": _EMPTY_TRANSITIONS,
+    "hired": _EMPTY_TRANSITIONS,
 }
 
 INTERVIEW_TRANSITIONS = {
-    "scheduled": {"rescheduled", "awaiting_feedback", "cancelled"},
-    "rescheduled": {"awaiting_feedback", "cancelled"},
-    "awaiting_feedback": {"completed"},
-    "completed": set(),
-    "cancelled": set(),
+    "scheduled": frozenset({"rescheduled", "awaiting_feedback", "cancelled"}),
+    "rescheduled": frozenset({"awaiting_feedback", "cancelled"}),
+    "awaiting_feedback": frozenset({"completed"}),
+    "completed": _EMPTY_TRANSITIONS,
+    "cancelled": _EMPTY_TRANSITIONS,
 }
 
 ALLOWED_ROLES = {"admin", "hr", "candidate", "interviewer"}
@@ -45,9 +52,39 @@ def _get_user(db: Session, user_id: int) -> User:
     return row
 
 
+# user_id -> token_version, so routine version checks skip the DB round-trip.
+# Entries expire after 60s and are dropped eagerly when a version is bumped.
+# Handlers run on the threadpool, so guard the cache with a lock — TTLCache
+# mutates its expiry list even on reads and is not thread-safe.
+_version_cache: TTLCache = TTLCache(maxsize=50000, ttl=60)
+_version_cache_lock = threading.Lock()
+
+
+def _invalidate_cached_version(user_id: int):
+    """Drop the cached token version after a security-relevant bump"""
+    with _version_cache_lock:
+        _version_cache.pop(user_id, None)
+
+
+def _check_token_version(current: dict, db: Session):
+    """Verify token version, hitting the DB only on cache miss or mismatch"""
+    user_id = current["user_id"]
+    with _version_cache_lock:
+        cached = _version_cache.get(user_id)
+    if cached == current["token_version"]:
+        return
+    user = _get_user(db, user_id)
+    with _version_cache_lock:
+        _version_cache[user_id] = user.token_version
+    if user.token_version != current["token_version"]:
+        raise HTTPException(status_code=401, detail="Token expired after security update")
+
+
 def _current_db_user(current: dict, db: Session) -> User:
     """Get current user from DB and verify token version"""
     user = _get_user(db, current["user_id"])
+    with _version_cache_lock:
+        _version_cache[user.user_id] = user.token_version
     if user.token_version != current["token_version"]:
         raise HTTPException(status_code=401, detail="Token expired after security update")
     return user
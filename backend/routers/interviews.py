@@ -1,14 +1,17 @@
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import exists, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..authentication import get_current_user
 from ..authorize import enforce_owner_or_admin, require_roles
 from ..Database import get_db
+from ..orjson_response import ORJSONResponse
 from ..Models import Application, Candidate, Interview, InterviewFeedback, Job, User
-from ..schemas import InterviewCreate, InterviewFeedbackCreate, InterviewUpdate
-from .dependencies import APP_TRANSITIONS, INTERVIEW_TRANSITIONS, _audit, _current_db_user, _notify
+from ..schemas import InterviewCreate, InterviewFeedbackCreate, InterviewFeedbackResponse, InterviewResponse, InterviewUpdate
+from .dependencies import APP_TRANSITIONS, INTERVIEW_TRANSITIONS, _EMPTY_TRANSITIONS, _audit, _check_token_version, _current_db_user, _notify
 
 INTERVIEW_DURATION = timedelta(hours=1)
 
@@ -100,8 +103,10 @@ def get_my_interviews(
                 "recommendation": feedback.recommendation if feedback else None,
             } if feedback else None,
         })
-    
-    return result
+
+    # Return the response class directly so datetimes reach orjson intact
+    # (UTC "Z" form) instead of being pre-stringified by jsonable_encoder.
+    return ORJSONResponse(result)
 
 
 @router.get("/candidate")
@@ -139,7 +144,7 @@ def get_candidate_interviews(
             "department": job.department if job else "Unknown",
         })
 
-    return result
+    return ORJSONResponse(result)
 
 
 @router.get("/application/{application_id}")
@@ -176,17 +181,17 @@ def get_interviews_for_application(
             "interviewer_name": interviewer.name if interviewer else "Unknown",
         })
 
-    return result
+    return ORJSONResponse(result)
 
 
-@router.post("")
+@router.post("", responses={200: {"model": InterviewResponse}})
 def create_interview(
     payload: InterviewCreate,
     current=Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Schedule a new interview (HR/Admin)"""
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     require_roles("HR", "admin")(current)
     current_time = datetime.utcnow()
 
@@ -253,25 +258,27 @@ def create_interview(
     if candidate_conflict:
         raise HTTPException(status_code=400, detail="Candidate already has an interview scheduled at this time")
 
-    row = Interview(
-        application_id=payload.application_id,
-        interview_date=payload.interview_date,
-        interview_type=payload.interview_type,
-        interviewer_id=payload.interviewer_id,
-        interview_status="scheduled",
-    )
+    try:
+        row = db.execute(
+            insert(Interview)
+            .values(interview_status="scheduled", **payload.dump_insert())
+            .returning(Interview)
+        ).scalar_one()
+    except IntegrityError:
+        # Concurrent request won the slot between our conflict check and this
+        # INSERT; the partial unique index on (interviewer_id, interview_date)
+        # turns the race into a clean 400.
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Interviewer has a calendar conflict")
     app_row.application_status = "interview_scheduled"
-    db.add(row)
-    
+
     _notify(db, app_row.candidate_id, "Interview scheduled", "info", app_row.application_id)
-    db.commit()
-    db.refresh(row)
     _audit(db, current["user_id"], f"interview_scheduled:{row.interview_id}:app_{payload.application_id}")
     db.commit()
-    return row
+    return Response(InterviewResponse.__fast_json__(row), media_type="application/json")
 
 
-@router.patch("/{interview_id}")
+@router.patch("/{interview_id}", responses={200: {"model": InterviewResponse}})
 def update_interview(
     interview_id: int,
     payload: InterviewUpdate,
@@ -279,14 +286,14 @@ def update_interview(
     db: Session = Depends(get_db)
 ):
     """Update interview details"""
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     require_roles("HR", "admin")(current)
     
     row = db.query(Interview).filter(Interview.interview_id == interview_id).first()
     if not row:
         raise HTTPException(status_code=404, detail="Interview not found")
 
-    if payload.interview_status and payload.interview_status not in INTERVIEW_TRANSITIONS.get(row.interview_status, set()):
+    if payload.interview_status and payload.interview_status not in INTERVIEW_TRANSITIONS.get(row.interview_status, _EMPTY_TRANSITIONS):
         raise HTTPException(status_code=400, detail="Invalid interview transition")
 
     if payload.interview_date is not None:
@@ -295,9 +302,16 @@ def update_interview(
         row.interview_type = payload.interview_type
     if payload.interview_status is not None:
         row.interview_status = payload.interview_status
-    
-    db.commit()
-    return row
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # The new date lands on a slot another active interview already
+        # holds; the partial unique index on (interviewer_id, interview_date)
+        # rejects it, so surface the same 400 as create_interview.
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Interviewer has a calendar conflict")
+    return Response(InterviewResponse.__fast_json__(row), media_type="application/json")
 
 
 @router.delete("/{interview_id}")
@@ -341,7 +355,7 @@ def delete_interview(
     return {"message": "Interview deleted successfully"}
 
 
-@router.post("/{interview_id}/reschedule")
+@router.post("/{interview_id}/reschedule", responses={200: {"model": InterviewResponse}})
 def reschedule_interview(
     interview_id: int,
     payload: InterviewUpdate,
@@ -412,9 +426,7 @@ def reschedule_interview(
     
     if payload.interview_type:
         row.interview_type = payload.interview_type
-    
-    db.commit()
-    
+
     # Notify candidate about reschedule
     _notify(
         db,
@@ -426,10 +438,10 @@ def reschedule_interview(
     
     _audit(db, current["user_id"], f"interview_rescheduled:{interview_id}")
     db.commit()
-    return row
+    return Response(InterviewResponse.__fast_json__(row), media_type="application/json")
 
 
-@router.post("/feedback")
+@router.post("/feedback", responses={200: {"model": InterviewFeedbackResponse}})
 def submit_feedback(
     payload: InterviewFeedbackCreate,
     current=Depends(get_current_user),
@@ -446,24 +458,21 @@ def submit_feedback(
         raise HTTPException(status_code=403, detail="Only assigned interviewer can submit feedback")
     if interview.interview_date > datetime.utcnow():
         raise HTTPException(status_code=400, detail="Feedback can only be submitted after the interview")
-    if db.query(InterviewFeedback).filter(InterviewFeedback.interview_id == interview.interview_id).first():
+    if db.query(exists().where(InterviewFeedback.interview_id == interview.interview_id)).scalar():
         raise HTTPException(status_code=400, detail="Feedback is write-once")
 
     interview.interview_status = "completed"
 
-    row = InterviewFeedback(
-        interview_id=payload.interview_id,
-        interviewer_id=user.user_id,
-        rating=payload.rating,
-        comments=payload.comments,
-        recommendation=payload.recommendation,
-    )
-    db.add(row)
-    db.commit()
-    db.refresh(row)
+    values = payload.dump_insert()
+    values["interviewer_id"] = user.user_id  # trust the session, not the body
+    row = db.execute(
+        insert(InterviewFeedback)
+        .values(**values)
+        .returning(InterviewFeedback)
+    ).scalar_one()
     _audit(db, user.user_id, f"feedback_submitted:{payload.interview_id}")
     db.commit()
-    return row
+    return Response(InterviewFeedbackResponse.__fast_json__(row), media_type="application/json")
 
 
 @router.post("/{interview_id}/hire")
@@ -491,11 +500,11 @@ def hire_candidate(
         job = db.query(Job).filter(Job.job_id == app_row.job_id).first()
         enforce_owner_or_admin(current, job.owner_hr_id)
 
-    if row.interview_status not in INTERVIEW_TRANSITIONS or "completed" not in INTERVIEW_TRANSITIONS.get(row.interview_status, set()):
+    if row.interview_status not in INTERVIEW_TRANSITIONS or "completed" not in INTERVIEW_TRANSITIONS.get(row.interview_status, _EMPTY_TRANSITIONS):
         if row.interview_status != "completed":
             raise HTTPException(status_code=400, detail="Interview cannot be completed from current status")
 
-    if app_row.application_status not in APP_TRANSITIONS or "hired" not in APP_TRANSITIONS.get(app_row.application_status, set()):
+    if app_row.application_status not in APP_TRANSITIONS or "hired" not in APP_TRANSITIONS.get(app_row.application_status, _EMPTY_TRANSITIONS):
         if app_row.application_status != "hired":
             raise HTTPException(status_code=400, detail="Application cannot be moved to hired from current status")
 
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
 from ..authentication import get_current_user
 from ..authorize import enforce_owner_or_admin, require_roles
 from ..Database import get_db
 from ..Models import Application, Interview, Job
-from ..schemas import JobCreate, JobStateUpdate
-from .dependencies import JOB_TRANSITIONS, _audit, _current_db_user
+from ..schemas import JobCreate, JobResponse, JobStateUpdate
+from ..structs import JobStruct, to_struct
+from .dependencies import JOB_TRANSITIONS, _EMPTY_TRANSITIONS, _audit, _check_token_version, _current_db_user
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
@@ -24,10 +27,13 @@ def list_jobs(
         q = q.filter(Job.job_status == status)
     total = q.count()
     items = q.order_by(Job.posted_date.desc()).offset((page - 1) * page_size).limit(page_size).all()
-    return {"total": total, "items": items}
+    # Rows are trusted DB output, so encode them straight through msgspec
+    # structs instead of the pydantic validate-then-dump path.
+    body = msgspec.json.encode({"total": total, "items": [to_struct(JobStruct, j) for j in items]})
+    return Response(body, media_type="application/json")
 
 
-@router.post("")
+@router.post("", responses={200: {"model": JobResponse}})
 def create_job(
     payload: JobCreate,
     current=Depends(get_current_user),
@@ -37,32 +43,28 @@ def create_job(
     actor = _current_db_user(current, db)
     require_roles("hr", "admin")(current)
     
-    row = Job(
-        owner_hr_id=actor.user_id,
-        job_title=payload.job_title,
-        job_description=payload.job_description,
-        department=payload.department,
-        experience_required=payload.experience_required,
-        job_status="draft",
-    )
-    db.add(row)
-    db.commit()
-    db.refresh(row)
+    values = payload.dump_insert()
+    values.pop("job_status", None)  # new jobs always start in draft
+    row = db.execute(
+        insert(Job)
+        .values(owner_hr_id=actor.user_id, job_status="draft", **values)
+        .returning(Job)
+    ).scalar_one()
     _audit(db, actor.user_id, f"job_created:{row.job_id}")
     db.commit()
-    return row
+    return Response(JobResponse.__fast_json__(row), media_type="application/json")
 
 
-@router.get("/{job_id}")
+@router.get("/{job_id}", responses={200: {"model": JobResponse}})
 def get_job(job_id: int, db: Session = Depends(get_db)):
     """Get job details by ID"""
     row = db.query(Job).filter(Job.job_id == job_id).first()
     if not row:
         raise HTTPException(status_code=404, detail="Job not found")
-    return row
+    return Response(JobResponse.__fast_json__(row), media_type="application/json")
 
 
-@router.patch("/{job_id}/state")
+@router.patch("/{job_id}/state", responses={200: {"model": JobResponse}})
 def update_job_state(
     job_id: int,
     payload: JobStateUpdate,
@@ -70,30 +72,30 @@ def update_job_state(
     db: Session = Depends(get_db)
 ):
     """Update job status (HR/Admin)"""
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     row = db.query(Job).filter(Job.job_id == job_id).first()
     if not row:
         raise HTTPException(status_code=404, detail="Job not found")
     enforce_owner_or_admin(current, row.owner_hr_id)
 
-    if payload.job_status not in JOB_TRANSITIONS.get(row.job_status, set()):
+    if payload.job_status not in JOB_TRANSITIONS.get(row.job_status, _EMPTY_TRANSITIONS):
         raise HTTPException(status_code=400, detail="Invalid job state transition")
     
     old_status = row.job_status
     row.job_status = payload.job_status
     _audit(db, current["user_id"], f"job_status_changed:{job_id}:{old_status}->{payload.job_status}")
     db.commit()
-    return row
+    return Response(JobResponse.__fast_json__(row), media_type="application/json")
 
 
-@router.patch("/{job_id}/reopen")
+@router.patch("/{job_id}/reopen", responses={200: {"model": JobResponse}})
 def reopen_job(
     job_id: int,
     current=Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Reopen an archived job (Admin only)"""
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     require_roles("admin")(current)
     
     row = db.query(Job).filter(Job.job_id == job_id).first()
@@ -103,7 +105,7 @@ def reopen_job(
     # Admin override - can reopen any job
     row.job_status = "open"
     db.commit()
-    return row
+    return Response(JobResponse.__fast_json__(row), media_type="application/json")
 
 
 @router.get("/{job_id}/analytics")
@@ -113,14 +115,19 @@ def job_analytics(
     db: Session = Depends(get_db)
 ):
     """Get job analytics (HR/Admin)"""
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     require_roles("hr", "admin")(current)
 
-    app_count = db.query(Application).filter(Application.job_id == job_id).count()
-    interview_count = (
-        db.query(Interview)
-        .join(Application, Interview.application_id == Application.application_id)
+    # Single round-trip: count applications and joined interviews in one
+    # aggregate query instead of two separate SELECT COUNT(*) calls.
+    counts = (
+        db.query(
+            func.count(func.distinct(Application.application_id)).label("applications"),
+            func.count(Interview.interview_id).label("interviews"),
+        )
+        .select_from(Application)
+        .outerjoin(Interview, Interview.application_id == Application.application_id)
         .filter(Application.job_id == job_id)
-        .count()
+        .one()
     )
-    return {"job_id": job_id, "applications": app_count, "interviews": interview_count}
+    return {"job_id": job_id, "applications": counts.applications, "interviews": counts.interviews}
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from ..authentication import get_current_user
 from ..authorize import require_roles
 from ..Database import get_db
 from ..Models import Candidate, CandidateNotification
+from ..orjson_response import ORJSONResponse
+from ..schemas import NOTIFICATION_LIST_ADAPTER, dump_rows
 from .dependencies import _current_db_user
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
@@ -23,9 +25,13 @@ def my_notifications(
     if not candidate:
         return []
     
-    return db.query(CandidateNotification).filter(
-        CandidateNotification.candidate_id == candidate.candidate_id
-    ).all()
+    rows = (
+        db.query(CandidateNotification)
+        .options(raiseload("*"))
+        .filter(CandidateNotification.candidate_id == candidate.candidate_id)
+        .all()
+    )
+    return ORJSONResponse(dump_rows(NOTIFICATION_LIST_ADAPTER, rows))
 
 
 @router.patch("/{notification_id}/read")
@@ -52,9 +58,20 @@ def mark_read(
     
     row.is_read = True
     db.commit()
-    
-    updated_row = db.query(CandidateNotification).filter(
-        CandidateNotification.notification_id == notification_id
-    ).first()
-    
-    return {"message": "Notification marked as read", "notification": updated_row}
+
+    # Return the response class directly so the timestamp reaches orjson
+    # intact (UTC "Z" form) instead of jsonable_encoder pre-stringifying it.
+    return ORJSONResponse(
+        {
+            "message": "Notification marked as read",
+            "notification": {
+                "notification_id": row.notification_id,
+                "candidate_id": row.candidate_id,
+                "notification_type": row.notification_type,
+                "message": row.message,
+                "related_application_id": row.related_application_id,
+                "is_read": row.is_read,
+                "created_at": row.created_at,
+            },
+        }
+    )
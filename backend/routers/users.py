@@ -1,12 +1,21 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session, load_only, raiseload
 
 from ..authentication import get_current_user
 from ..authorize import enforce_self_or_admin, require_roles
 from ..Database import get_db
+from ..orjson_response import ORJSON_OPTIONS
 from ..Models import User
-from ..schemas import RoleChangeRequest, UserUpdate
-from .dependencies import _audit, _current_db_user, _get_user, _normalize_role
+from ..schemas import RoleChangeRequest, UserResponse, UserUpdate
+from .dependencies import (
+    _audit,
+    _check_token_version,
+    _current_db_user,
+    _get_user,
+    _invalidate_cached_version,
+    _normalize_role,
+)
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -22,9 +31,22 @@ def list_users(
 ):
     """List all users (admin only)"""
     require_roles("admin")(current)
-    _current_db_user(current, db)
+    _check_token_version(current, db)
 
-    q = db.query(User)
+    # Project only the columns the admin UI shows — keeps password and
+    # token_version out of both the SELECT and the serialized response.
+    q = db.query(User).options(
+        load_only(
+            User.user_id,
+            User.name,
+            User.email,
+            User.role,
+            User.status,
+            User.is_active,
+            User.created_at,
+        ),
+        raiseload("*"),
+    )
     if role:
         q = q.filter(User.role == role)
     if status_filter == "active":
@@ -35,10 +57,27 @@ def list_users(
         q = q.filter(User.status == status_filter)
     total = q.count()
     items = q.offset((page - 1) * page_size).limit(page_size).all()
-    return {"total": total, "items": items}
+    # One comprehension into plain dicts and a single orjson.dumps; no
+    # per-row encoder pass over the ORM objects.
+    payload = {
+        "total": total,
+        "items": [
+            {
+                "user_id": u.user_id,
+                "name": u.name,
+                "email": u.email,
+                "role": u.role,
+                "status": u.status,
+                "is_active": u.is_active,
+                "created_at": u.created_at,
+            }
+            for u in items
+        ],
+    }
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), media_type="application/json")
 
 
-@router.patch("/{user_id}")
+@router.patch("/{user_id}", responses={200: {"model": UserResponse}})
 def update_user(
     user_id: int,
     payload: UserUpdate,
@@ -46,7 +85,7 @@ def update_user(
     db: Session = Depends(get_db)
 ):
     """Update user details"""
-    _current_db_user(current, db)
+    _check_token_version(current, db)
     enforce_self_or_admin(current, user_id)
     user = _get_user(db, user_id)
     
@@ -57,7 +96,7 @@ def update_user(
     _audit(db, current["user_id"], f"user_updated:{user_id}")
     db.commit()
     db.refresh(user)
-    return user
+    return Response(UserResponse.__fast_json__(user), media_type="application/json")
 
 
 @router.post("/{user_id}/role")
@@ -79,6 +118,7 @@ def change_role(
     
     _audit(db, actor.user_id, f"role_changed:{user_id}:{old}->{new_role}")
     db.commit()
+    _invalidate_cached_version(user_id)
     return {"message": "Role changed"}
 
 
@@ -99,6 +139,7 @@ def deactivate_user(
     
     _audit(db, actor.user_id, f"user_deactivated:{user_id}")
     db.commit()
+    _invalidate_cached_version(user_id)
     return {"message": "User deactivated"}
 
 
@@ -1,251 +0,0 @@
-from datetime import datetime
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
-
-
-class UserBase(BaseModel):
-    name: str
-    email: str
-    role: str
-    status: str = "active"
-
-
-class UserCreate(UserBase):
-    password: str
-    
-
-class UserResponse(UserBase):
-    user_id: int
-    is_active: bool = True
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class UserLogin(BaseModel):
-    email: str
-    password: str
-
-
-class UserUpdate(BaseModel):
-    status: Optional[str] = None
-
-
-class RoleChangeRequest(BaseModel):
-    new_role: str
-
-
-class TokenRefreshRequest(BaseModel):
-    refresh_token: str
-
-
-class PasswordChangeRequest(BaseModel):
-    old_password: str
-    new_password: str
-
-
-class CandidateBase(BaseModel):
-    phone: Optional[str] = None
-    skills: Optional[str] = None
-    experience_years: Optional[int] = None
-    resume_path: Optional[str] = None
-
-
-class CandidateCreate(CandidateBase):
-    user_id: int
-
-
-class CandidateResponse(CandidateBase):
-    candidate_id: int
-    user_id: int
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class CandidateUpdate(BaseModel):
-    phone: Optional[str] = None
-    skills: Optional[str] = None
-    experience_years: Optional[int] = None
-    resume_path: Optional[str] = None
-
-
-
-
-
-class JobBase(BaseModel):
-    job_title: str
-    job_description: str
-    department: Optional[str] = None
-    experience_required: Optional[int] = None
-    job_status: str = "open"
-
-
-class JobCreate(JobBase):
-    pass
-
-
-class JobResponse(JobBase):
-    job_id: int
-    posted_date: datetime
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class JobUpdate(BaseModel):
-    job_title: Optional[str] = None
-    job_description: Optional[str] = None
-    department: Optional[str] = None
-    experience_required: Optional[int] = None
-    job_status: Optional[str] = None
-
-
-class JobStateUpdate(BaseModel):
-    job_status: str
-
-
-class ApplicationBase(BaseModel):
-    candidate_id: int
-    job_id: int
-    application_status: str = "applied"
-
-
-class ApplicationCreate(BaseModel):
-    job_id: int
-
-
-class ApplicationResponse(ApplicationBase):
-    application_id: int
-    applied_date: datetime
-    last_updated: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class ApplicationUpdate(BaseModel):
-    application_status: str
-
-
-class BulkStatusUpdate(BaseModel):
-    application_ids: List[int]
-
-
-class ApplicationDetailResponse(ApplicationResponse):
-    candidate: Optional["CandidateResponse"] = None
-    job: Optional["JobResponse"] = None
-
-
-class InterviewBase(BaseModel):
-    application_id: int
-    interview_date: datetime
-    interview_type: str
-    interviewer_id: int
-    interview_status: str = "scheduled"
-
-
-class InterviewCreate(BaseModel):
-    application_id: int
-    interview_date: datetime
-    interview_type: str
-    interviewer_id: int
-
-
-class InterviewResponse(InterviewBase):
-    interview_id: int
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class InterviewUpdate(BaseModel):
-    interview_date: Optional[datetime] = None
-    interview_type: Optional[str] = None
-    interviewer_id: Optional[int] = None
-    interview_status: Optional[str] = None
-
-
-class InterviewFeedbackBase(BaseModel):
-    interview_id: int
-    interviewer_id: int
-    rating: Optional[float] = Field(default=None, gt=0, lt=6)
-    comments: Optional[str] = None
-    recommendation: Optional[str] = None
-
-
-class InterviewFeedbackCreate(InterviewFeedbackBase):
-    pass
-
-
-class InterviewFeedbackResponse(InterviewFeedbackBase):
-    feedback_id: int
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class InterviewFeedbackUpdate(BaseModel):
-    rating: Optional[float] = None
-    comments: Optional[str] = None
-    recommendation: Optional[str] = None
-
-
-class CandidateNotificationBase(BaseModel):
-    candidate_id: int
-    message: str
-    related_application_id: Optional[int] = None
-    is_read: bool = False
-
-
-class CandidateNotificationCreate(BaseModel):
-    message: str
-    related_application_id: Optional[int] = None
-
-
-class CandidateNotificationResponse(CandidateNotificationBase):
-    notification_id: int
-    notification_type: str = "info"
-    created_at: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class CandidateNotificationUpdate(BaseModel):
-    is_read: bool
-
-
-class AuditLogBase(BaseModel):
-    user_id: int
-    action: str
-    ip_address: Optional[str] = None
-
-
-class AuditLogCreate(BaseModel):
-    action: str
-    ip_address: Optional[str] = None
-
-
-class AuditLogResponse(AuditLogBase):
-    log_id: int
-    timestamp: datetime
-
-    class Config:
-        from_attributes = True
-
-
-class InterviewDetailResponse(InterviewResponse):
-    application: Optional["ApplicationResponse"] = None
-    interviewer: Optional["UserResponse"] = None
-    feedback: Optional[InterviewFeedbackResponse] = None
-
-
-class ApplicationWithInterviewsResponse(ApplicationDetailResponse):
-    interviews: List[InterviewDetailResponse] = []
@@ -0,0 +1,83 @@
+"""Pydantic schemas, split per entity.
+
+Importing this package is nearly free: attribute access lazily imports only
+the submodule defining the requested name (PEP 562), so a router touching a
+single entity builds only that entity's schema graph. ``from ..schemas
+import X`` keeps working for every name the old flat module exported.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    # common
+    "Email": "common",
+    "JobStatus": "common",
+    "ApplicationStatus": "common",
+    "InterviewStatus": "common",
+    "InterviewType": "common",
+    "Recommendation": "common",
+    "make_partial": "common",
+    "dump_rows": "common",
+    # user
+    "UserBase": "user",
+    "UserCreate": "user",
+    "UserResponse": "user",
+    "UserLogin": "user",
+    "UserUpdate": "user",
+    "RoleChangeRequest": "user",
+    "TokenRefreshRequest": "user",
+    "PasswordChangeRequest": "user",
+    # candidate
+    "CandidateBase": "candidate",
+    "CandidateCreate": "candidate",
+    "CandidateResponse": "candidate",
+    "CandidateUpdate": "candidate",
+    # job
+    "JobBase": "job",
+    "JobCreate": "job",
+    "JobResponse": "job",
+    "JobUpdate": "job",
+    "JobStateUpdate": "job",
+    # application
+    "ApplicationBase": "application",
+    "ApplicationCreate": "application",
+    "ApplicationResponse": "application",
+    "ApplicationUpdate": "application",
+    "BulkStatusUpdate": "application",
+    # interview
+    "InterviewBase": "interview",
+    "InterviewCreate": "interview",
+    "InterviewResponse": "interview",
+    "InterviewUpdate": "interview",
+    "InterviewFeedbackBase": "interview",
+    "InterviewFeedbackCreate": "interview",
+    "InterviewFeedbackResponse": "interview",
+    "InterviewFeedbackUpdate": "interview",
+    # notification
+    "CandidateNotificationBase": "notification",
+    "CandidateNotificationCreate": "notification",
+    "CandidateNotificationResponse": "notification",
+    "CandidateNotificationUpdate": "notification",
+    "NOTIFICATION_LIST_ADAPTER": "notification",
+    # audit
+    "AuditLogBase": "audit",
+    "AuditLogCreate": "audit",
+    "AuditLogResponse": "audit",
+    "AUDIT_LOG_LIST_ADAPTER": "audit",
+    # composite
+    "ApplicationDetailResponse": "composite",
+    "InterviewDetailResponse": "composite",
+    "ApplicationWithInterviewsResponse": "composite",
+}
+
+
+def __getattr__(name: str):
+    try:
+        submodule = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(import_module(f".{submodule}", __name__), name)
+
+
+def __dir__():
+    return sorted(_EXPORTS)
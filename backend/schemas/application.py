@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, ConfigDict
+
+from .common import ApplicationStatus, InsertModel, install_fast_json
+
+
+class ApplicationBase(BaseModel):
+    candidate_id: int
+    job_id: int
+    application_status: ApplicationStatus = "applied"
+
+
+class ApplicationCreate(InsertModel):
+    job_id: int
+
+
+class ApplicationResponse(ApplicationBase):
+    application_id: int
+    applied_date: datetime
+    last_updated: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+class ApplicationUpdate(BaseModel):
+    application_status: ApplicationStatus
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class BulkStatusUpdate(BaseModel):
+    application_ids: List[int]
+
+    model_config = ConfigDict(extra="forbid")
+
+
+install_fast_json(globals())
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from .common import install_fast_json
+
+
+class AuditLogBase(BaseModel):
+    user_id: int
+    action: str
+    ip_address: Optional[str] = None
+
+
+class AuditLogCreate(BaseModel):
+    action: str
+    ip_address: Optional[str] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AuditLogResponse(AuditLogBase):
+    log_id: int
+    timestamp: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+install_fast_json(globals())
+
+# Built once at import; TypeAdapter construction walks the full core schema,
+# so the list endpoint reuses this instead of rebuilding it per call.
+AUDIT_LOG_LIST_ADAPTER = TypeAdapter(List[AuditLogResponse])
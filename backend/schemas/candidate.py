@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .common import Phone, install_fast_json, make_partial
+
+
+class CandidateBase(BaseModel):
+    phone: Optional[Phone] = None
+    skills: Optional[str] = None
+    experience_years: Optional[int] = None
+    resume_path: Optional[str] = None
+
+
+class CandidateCreate(CandidateBase):
+    user_id: int
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class CandidateResponse(CandidateBase):
+    candidate_id: int
+    user_id: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+CandidateUpdate = make_partial(CandidateBase, "CandidateUpdate")
+
+
+install_fast_json(globals())
@@ -0,0 +1,128 @@
+"""Shared schema building blocks: validated types, Literal vocabularies and
+the helpers the per-entity modules use to build and serialize their models."""
+
+from copy import deepcopy
+from functools import lru_cache
+from typing import Annotated, Literal, Optional, get_args
+
+import orjson
+from pydantic import AfterValidator, BaseModel, ConfigDict, StringConstraints, TypeAdapter, create_model
+
+from ..orjson_response import ORJSON_OPTIONS, _default
+
+
+@lru_cache(maxsize=1024)
+def _validate_email(value: str) -> str:
+    """Validate and normalize an email address.
+
+    email_validator is imported on first use, not at module import, so app
+    cold start doesn't pay its import cost; requests only hit the import the
+    first time an email field is validated. The lru_cache absorbs repeat
+    logins from the same address, skipping the library's parse entirely.
+    """
+    from email_validator import EmailNotValidError, validate_email
+
+    try:
+        return validate_email(value, check_deliverability=False).normalized
+    except EmailNotValidError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+Email = Annotated[str, AfterValidator(_validate_email)]
+
+# Matched by pydantic-core's Rust regex engine; no Python-level re involved.
+Phone = Annotated[str, StringConstraints(pattern=r"^\+?[0-9\-() ]{6,20}$", strip_whitespace=True)]
+
+# Closed vocabularies for the stringly-typed state fields; pydantic-core
+# validates a Literal with a set lookup over interned strings instead of
+# accepting any str. Role stays plain str because registration normalizes
+# case ("HR" -> "hr") after validation, which a Literal would reject.
+JobStatus = Literal["draft", "open", "closed", "archived"]
+ApplicationStatus = Literal["applied", "shortlisted", "interview_scheduled", "rejected", "hired"]
+InterviewStatus = Literal["scheduled", "rescheduled", "awaiting_feedback", "completed", "cancelled"]
+InterviewType = Literal["technical", "hr", "managerial", "cultural"]
+Recommendation = Literal["strong_hire", "hire", "maybe", "no_hire"]
+
+
+class InsertModel(BaseModel):
+    """Mixin for *Create bodies whose fields flow straight into an INSERT.
+
+    The required-field set is computed once per class when pydantic finishes
+    building it, so dump_insert avoids the per-call exclude_unset walk: for a
+    creation payload, required fields are always set and the union with
+    model_fields_set picks up any optionals the client actually sent.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._REQUIRED = frozenset(f for f, info in cls.model_fields.items() if info.is_required())
+
+    def dump_insert(self) -> dict:
+        return self.model_dump(include=self._REQUIRED | self.model_fields_set)
+
+
+def make_partial(base: type[BaseModel], name: str, include: tuple[str, ...] | None = None) -> type[BaseModel]:
+    """Generate an all-optional update model from a base model's fields.
+
+    Each field keeps its constraints but gets an Optional annotation and a
+    None default; `include` limits which base fields are exposed. Deriving
+    the *Update models this way shares the base field definitions instead of
+    rebuilding a near-identical core schema for every hand-written copy.
+    Unknown keys are rejected so a typoed field fails loudly instead of
+    silently leaving the row unchanged.
+    """
+    fields = {}
+    for field_name, info in base.model_fields.items():
+        if include is not None and field_name not in include:
+            continue
+        partial_info = deepcopy(info)
+        partial_info.default = None
+        partial_info.default_factory = None
+        fields[field_name] = (Optional[info.annotation], partial_info)
+    return create_model(name, __config__=ConfigDict(extra="forbid"), **fields)
+
+
+def dump_rows(adapter: TypeAdapter, rows) -> list:
+    """Validate ORM rows through a cached list adapter for ORJSONResponse.
+
+    mode="python" keeps datetimes as datetime objects so the response class
+    formats them (naive UTC -> "...Z") instead of pydantic pre-stringifying
+    them without a timezone marker."""
+    return adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="python")
+
+
+def _is_flat(cls: type[BaseModel]) -> bool:
+    """True when no field of cls refers to another model (directly or in a
+    container), i.e. every field is a plain attribute read."""
+    for info in cls.model_fields.values():
+        for t in (info.annotation, *get_args(info.annotation)):
+            if isinstance(t, type) and issubclass(t, BaseModel):
+                return False
+    return True
+
+
+def _compile_fast_json(cls: type[BaseModel]):
+    """Generate a serializer that inlines every field of cls into one dict
+    literal and hands it to orjson. It only reads plain attributes, so it
+    accepts trusted ORM rows as well as model instances, replacing both the
+    generic model_dump field walk and the intermediate model construction."""
+    fields = ", ".join(f'"{name}": o.{name}' for name in cls.model_fields)
+    src = f"def _ser(o):\n    return orjson.dumps({{{fields}}}, default=_default, option=ORJSON_OPTIONS)"
+    namespace = {"orjson": orjson, "_default": _default, "ORJSON_OPTIONS": ORJSON_OPTIONS}
+    exec(src, namespace)
+    return staticmethod(namespace["_ser"])
+
+
+def install_fast_json(namespace: dict) -> None:
+    """Attach __fast_json__ to every flat *Response class in a module."""
+    for obj in list(namespace.values()):
+        if (
+            isinstance(obj, type)
+            and issubclass(obj, BaseModel)
+            and obj.__name__.endswith("Response")
+            and _is_flat(obj)
+        ):
+            obj.__fast_json__ = _compile_fast_json(obj)
@@ -0,0 +1,26 @@
+"""Nested response shapes combining several entities. Kept in their own
+module so routers that serve single-entity payloads never pay for building
+these larger schema graphs."""
+
+from typing import List
+
+from .application import ApplicationResponse
+from .candidate import CandidateResponse
+from .interview import InterviewFeedbackResponse, InterviewResponse
+from .job import JobResponse
+from .user import UserResponse
+
+
+class ApplicationDetailResponse(ApplicationResponse):
+    candidate: CandidateResponse | None = None
+    job: JobResponse | None = None
+
+
+class InterviewDetailResponse(InterviewResponse):
+    application: ApplicationResponse | None = None
+    interviewer: UserResponse | None = None
+    feedback: InterviewFeedbackResponse | None = None
+
+
+class ApplicationWithInterviewsResponse(ApplicationDetailResponse):
+    interviews: List[InterviewDetailResponse] = []
@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .common import InsertModel, InterviewStatus, InterviewType, Recommendation, install_fast_json, make_partial
+
+
+class InterviewBase(BaseModel):
+    application_id: int
+    interview_date: datetime
+    interview_type: InterviewType
+    interviewer_id: int
+    interview_status: InterviewStatus = "scheduled"
+
+
+class InterviewCreate(InsertModel):
+    application_id: int
+    interview_date: datetime
+    interview_type: InterviewType
+    interviewer_id: int
+
+
+class InterviewResponse(InterviewBase):
+    interview_id: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+InterviewUpdate = make_partial(
+    InterviewBase, "InterviewUpdate",
+    include=("interview_date", "interview_type", "interviewer_id", "interview_status"),
+)
+
+
+class InterviewFeedbackBase(BaseModel):
+    interview_id: int
+    interviewer_id: int
+    rating: Optional[float] = Field(default=None, gt=0, lt=6)
+    comments: Optional[str] = None
+    recommendation: Optional[Recommendation] = None
+
+
+class InterviewFeedbackCreate(InterviewFeedbackBase, InsertModel):
+    pass
+
+
+class InterviewFeedbackResponse(InterviewFeedbackBase):
+    feedback_id: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+InterviewFeedbackUpdate = make_partial(
+    InterviewFeedbackBase, "InterviewFeedbackUpdate",
+    include=("rating", "comments", "recommendation"),
+)
+
+
+install_fast_json(globals())
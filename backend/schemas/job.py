@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .common import InsertModel, JobStatus, install_fast_json, make_partial
+
+
+class JobBase(BaseModel):
+    job_title: str
+    job_description: str
+    department: Optional[str] = None
+    experience_required: Optional[int] = None
+    job_status: JobStatus = "open"
+
+
+class JobCreate(JobBase, InsertModel):
+    pass
+
+
+class JobResponse(JobBase):
+    job_id: int
+    posted_date: datetime
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+JobUpdate = make_partial(JobBase, "JobUpdate")
+
+
+class JobStateUpdate(BaseModel):
+    job_status: JobStatus
+
+    model_config = ConfigDict(extra="forbid")
+
+
+install_fast_json(globals())
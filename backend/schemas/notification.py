@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from .common import install_fast_json
+
+
+class CandidateNotificationBase(BaseModel):
+    candidate_id: int
+    message: str
+    related_application_id: Optional[int] = None
+    is_read: bool = False
+
+
+class CandidateNotificationCreate(BaseModel):
+    message: str
+    related_application_id: Optional[int] = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class CandidateNotificationResponse(CandidateNotificationBase):
+    notification_id: int
+    notification_type: str = "info"
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+class CandidateNotificationUpdate(BaseModel):
+    is_read: bool
+
+    model_config = ConfigDict(extra="forbid")
+
+
+install_fast_json(globals())
+
+# Built once at import; TypeAdapter construction walks the full core schema,
+# so the list endpoint reuses this instead of rebuilding it per call.
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[CandidateNotificationResponse])
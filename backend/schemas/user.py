@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from .common import Email, install_fast_json, make_partial
+
+
+class UserBase(BaseModel):
+    name: str
+    email: Email
+    role: str
+    status: str = "active"
+
+
+class UserCreate(UserBase):
+    password: str
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class UserResponse(UserBase):
+    user_id: int
+    is_active: bool = True
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+class UserLogin(BaseModel):
+    email: Email
+    password: str
+
+    model_config = ConfigDict(extra="forbid")
+
+
+UserUpdate = make_partial(UserBase, "UserUpdate", include=("status",))
+
+
+class RoleChangeRequest(BaseModel):
+    new_role: str
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class TokenRefreshRequest(BaseModel):
+    refresh_token: str
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class PasswordChangeRequest(BaseModel):
+    old_password: str
+    new_password: str
+
+    model_config = ConfigDict(extra="forbid")
+
+
+install_fast_json(globals())
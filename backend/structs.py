@@ -0,0 +1,69 @@
+"""msgspec Structs mirroring the hot list response shapes.
+
+The list endpoints only serialize trusted DB rows; msgspec encodes these
+structs straight to JSON bytes without the dict intermediates and per-field
+validation of the pydantic path. Request bodies stay on pydantic — these
+types are output-only.
+"""
+
+from datetime import datetime, timezone
+
+import msgspec
+
+
+class JobStruct(msgspec.Struct, gc=False):
+    job_id: int
+    job_title: str
+    job_description: str
+    department: str | None
+    experience_required: int | None
+    job_status: str
+    posted_date: datetime
+    created_at: datetime
+
+
+class CandidateStruct(msgspec.Struct, gc=False):
+    candidate_id: int
+    user_id: int
+    phone: str | None
+    skills: str | None
+    experience_years: int | None
+    resume_path: str | None
+    created_at: datetime
+
+
+class ApplicationDetailStruct(msgspec.Struct, gc=False):
+    application_id: int
+    candidate_id: int
+    job_id: int
+    application_status: str
+    applied_date: datetime
+    last_updated: datetime
+    candidate: CandidateStruct | None
+    job: JobStruct | None
+
+
+def _as_utc(value):
+    """Tag naive DB timestamps as UTC so msgspec emits the same "...Z" form
+    the orjson call sites produce."""
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def to_struct(struct_cls: type[msgspec.Struct], row) -> msgspec.Struct:
+    """Copy a trusted ORM row into a struct, field for field."""
+    return struct_cls(**{f: _as_utc(getattr(row, f)) for f in struct_cls.__struct_fields__})
+
+
+def application_detail_struct(row) -> ApplicationDetailStruct:
+    return ApplicationDetailStruct(
+        application_id=row.application_id,
+        candidate_id=row.candidate_id,
+        job_id=row.job_id,
+        application_status=row.application_status,
+        applied_date=_as_utc(row.applied_date),
+        last_updated=_as_utc(row.last_updated),
+        candidate=to_struct(CandidateStruct, row.candidate) if row.candidate else None,
+        job=to_struct(JobStruct, row.job) if row.job else None,
+    )